@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Depends, Request
+import asyncio, json
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from app.core.auth import get_api_key
-from app.models.spot import SpotSearchRequest, SpotSearchResponse
+from app.core.config import get_settings
+from app.models.spot import (
+    SpotSearchRequest, SpotSearchResponse,
+    JobSubmitResponse, JobStatusResponse, JobMetricsResponse,
+    PrefetchRequest, PrefetchResponse
+)
 from app.services.spot_service import SpotService
+from app.services.prefetch_cache import PrefetchCache
+from app.services.job_queue import JobQueue, JOB_QUEUED, JOB_SUCCEEDED, JOB_FINISHED_STATUSES
 from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_202_ACCEPTED, HTTP_404_NOT_FOUND
 
+settings = get_settings()
 router = APIRouter()
 spot_service = SpotService()
+job_queue = JobQueue()
+prefetch_cache = PrefetchCache()
 
 
 @router.get("/health")
@@ -37,8 +50,11 @@ async def stream_search_spots(
     """ユーザのリクエストに対し、検索結果とLLMのサマリーをストリーミングで返します。"""
 
     async def event_generator():
-        # 前処理：スポット情報の取得
-        search_results = await spot_service.preprocess_search(request_data.user_request)
+        # 前処理：スポット情報の取得（プリフェッチ済みであれば続きから）
+        prefetched_state = await prefetch_cache.take(request_data.user_request)
+        search_results = await spot_service.preprocess_search(
+            request_data.user_request, prefetched_state
+        )
 
         # LLMサマリーのストリーミング生成
         async for chunk in spot_service.stream_llm_summary(search_results, request):
@@ -48,3 +64,96 @@ async def stream_search_spots(
         event_generator(),
         media_type="text/event-stream"
     )
+
+
+@router.post("/prefetch", response_model=PrefetchResponse, status_code=HTTP_202_ACCEPTED)
+async def prefetch_search(
+    request: PrefetchRequest,
+    api_key: str = Depends(get_api_key)
+):
+    """入力途中の要望に対し、パイプライン前半を投機的に実行しておきます。"""
+    user_request = request.user_request
+    status = prefetch_cache.submit(
+        request.session_id,
+        user_request,
+        lambda: spot_service.prefetch_state(user_request)
+    )
+    return PrefetchResponse(status=status)
+
+
+################# 非同期ジョブ用のエンドポイント #################
+
+@router.post("/jobs", response_model=JobSubmitResponse, status_code=HTTP_202_ACCEPTED)
+async def submit_search_job(
+    request: SpotSearchRequest,
+    api_key: str = Depends(get_api_key)
+):
+    """検索ジョブを登録し、すぐにジョブIDを返します。"""
+    job_id = await run_in_threadpool(job_queue.enqueue, request.model_dump())
+    return JobSubmitResponse(job_id=job_id, status=JOB_QUEUED)
+
+
+@router.get("/jobs/metrics", response_model=JobMetricsResponse)
+async def get_job_metrics(api_key: str = Depends(get_api_key)):
+    """ジョブキューの深さなどのメトリクスを返します。"""
+    metrics = await run_in_threadpool(job_queue.metrics)
+    return JobMetricsResponse(**metrics)
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_search_job(
+    job_id: str,
+    api_key: str = Depends(get_api_key)
+):
+    """ジョブの状態と、完了していれば検索結果を返します。"""
+    job = await run_in_threadpool(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_search_job(
+    job_id: str,
+    request: Request,
+    api_key: str = Depends(get_api_key)
+):
+    """ジョブの状態の変化と結果をSSEで返します。"""
+    job = await run_in_threadpool(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Job not found")
+
+    async def event_generator():
+        current = job
+        last_status = None
+        while True:
+            if current is None:
+                response = {"type": "error", "content": "Job not found"}
+                yield f"data: {json.dumps(response, ensure_ascii=False)}\n\n"
+                break
+
+            if current["status"] != last_status:
+                last_status = current["status"]
+                response = {
+                    "type": "status",
+                    "content": {"status": last_status, "attempts": current["attempts"]}
+                }
+                yield f"data: {json.dumps(response, ensure_ascii=False)}\n\n"
+
+            if current["status"] in JOB_FINISHED_STATUSES:
+                if current["status"] == JOB_SUCCEEDED:
+                    response = {"type": "result", "content": current["result"]}
+                else:
+                    response = {"type": "error", "content": current["error"]}
+                yield f"data: {json.dumps(response, ensure_ascii=False)}\n\n"
+                break
+
+            if await request.is_disconnected():
+                break
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+            current = await run_in_threadpool(job_queue.get, job_id)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream"
+    )
@@ -22,6 +22,26 @@ class Settings(BaseSettings):
     # Google Cloud Project
     GOOGLE_CLOUD_PROJECT: str
 
+    # 非同期ジョブ（ワーカープール）設定
+    # ジョブキューはインスタンスローカルのSQLiteのため、複数インスタンスで共有できない。
+    # Cloud Runの本番デプロイではインプロセスのワーカーは無効にしている（cloudbuild.yaml参照）
+    JOB_DB_PATH: str = "/tmp/spot-finder/jobs.sqlite3"
+    # APIプロセス内でワーカープールを起動するかどうか。
+    # `python -m app.services.job_worker` を別途動かす場合はFalseにする
+    JOB_IN_PROCESS_WORKERS: bool = True
+    JOB_WORKER_COUNT: int = 2
+    JOB_MAX_RETRIES: int = 2
+    JOB_RETRY_BACKOFF_SECONDS: float = 5.0
+    JOB_RESULT_TTL_SECONDS: int = 3600
+    JOB_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    JOB_POLL_INTERVAL_SECONDS: float = 0.5
+
+    # 投機的プリフェッチ設定
+    PREFETCH_DEBOUNCE_SECONDS: float = 0.3
+    PREFETCH_TTL_SECONDS: int = 30
+    PREFETCH_MAX_CONCURRENCY: int = 2
+    PREFETCH_MAX_ENTRIES: int = 50
+
     class Config:
         env_file = ".env"
 
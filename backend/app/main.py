@@ -1,13 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.api.v1.endpoints import router as api_v1_router
+from app.services.job_worker import JobWorkerPool
 
 settings = get_settings()
 
+# 非同期ジョブ用のワーカープール
+job_worker_pool = JobWorkerPool()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.JOB_IN_PROCESS_WORKERS:
+        job_worker_pool.start()
+    yield
+    # プロセスのjoinでイベントループを止めないよう、別スレッドで停止する
+    await asyncio.to_thread(job_worker_pool.stop)
+
 app = FastAPI(
     title=settings.APP_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # CORSミドルウェアの設定
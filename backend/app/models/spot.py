@@ -155,3 +155,40 @@ class SpotSearchRequest(BaseModel):
 class SpotSearchResponse(BaseModel):
     places: List[PlaceWithNews]
     summary: str
+
+# 投機的プリフェッチ用のモデル
+class PrefetchRequest(BaseModel):
+    session_id: str = Field(..., description="入力中のクライアントを識別するID")
+    user_request: str = Field(..., description="入力途中のスポット探しの要望")
+
+class PrefetchResponse(BaseModel):
+    status: str = Field(
+        ..., description="プリフェッチの受付結果（accepted / cached / skipped）"
+    )
+
+# 非同期ジョブ用のモデル
+class JobSubmitResponse(BaseModel):
+    job_id: str = Field(..., description="ジョブID")
+    status: str = Field(..., description="ジョブの状態")
+
+class JobStatusResponse(BaseModel):
+    job_id: str = Field(..., description="ジョブID")
+    status: str = Field(
+        ..., description="ジョブの状態（queued / running / succeeded / failed）"
+    )
+    attempts: int = Field(default=0, description="実行を試みた回数")
+    created_at: datetime
+    updated_at: datetime
+    result: Optional[SpotSearchResponse] = Field(
+        default=None, description="検索結果（成功時のみ）"
+    )
+    error: Optional[str] = Field(default=None, description="エラー内容（失敗時のみ）")
+
+class JobMetricsResponse(BaseModel):
+    queued: int = Field(default=0, description="待機中のジョブ数（キューの深さ）")
+    running: int = Field(default=0, description="実行中のジョブ数")
+    succeeded: int = Field(default=0, description="成功したジョブ数（TTL内）")
+    failed: int = Field(default=0, description="失敗したジョブ数（TTL内）")
+    oldest_queued_age_seconds: Optional[float] = Field(
+        default=None, description="最も古い待機中ジョブの待ち時間（秒）"
+    )
@@ -0,0 +1,235 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED)
+
+
+class JobQueue:
+    """SQLiteをバックエンドにしたローカルのジョブキュー
+
+    APIプロセスとワーカープロセスの間で共有されるため、
+    各メソッドは毎回コネクションを開いてトランザクション単位で処理します。
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or settings.JOB_DB_PATH
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_available "
+                "ON jobs (status, available_at)"
+            )
+        finally:
+            conn.close()
+
+    def enqueue(self, payload: Dict[str, Any]) -> str:
+        """ジョブを登録し、ジョブIDを返す"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO jobs (id, status, payload, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, JOB_QUEUED, json.dumps(payload, ensure_ascii=False), now, now, now)
+            )
+        finally:
+            conn.close()
+        return job_id
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """実行可能なジョブを1件取り出し、実行中にする
+
+        可視性タイムアウトを過ぎた実行中ジョブ（ワーカーが落ちたもの）も、
+        リトライ回数が残っていれば再取得の対象とします。残っていなければ失敗にします。
+        """
+        now = time.time()
+        stale_before = now - settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ?, finished_at = ? "
+                "WHERE status = ? AND started_at < ? AND attempts > ?",
+                (JOB_FAILED, "Job timed out", now, now,
+                 JOB_RUNNING, stale_before, settings.JOB_MAX_RETRIES)
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs "
+                "WHERE (status = ? AND available_at <= ?) "
+                "   OR (status = ? AND started_at < ? AND attempts <= ?) "
+                "ORDER BY created_at LIMIT 1",
+                (JOB_QUEUED, now, JOB_RUNNING, stale_before, settings.JOB_MAX_RETRIES)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, "
+                    "started_at = ?, updated_at = ? WHERE id = ?",
+                    (JOB_RUNNING, now, now, row["id"])
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN自体が失敗した場合はトランザクションが無いのでROLLBACKしない
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        # 行はUPDATE前に読んでいるので、更新後の値に揃える
+        job = dict(row)
+        job["status"] = JOB_RUNNING
+        job["attempts"] += 1
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def complete(self, job_id: str, attempts: int, result: Dict[str, Any]) -> bool:
+        """ジョブを成功として記録する
+
+        attemptsをフェンシングトークンとして使い、取得し直された古い実行からの書き込みは無視します。
+        書き込めた場合にTrueを返します。
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, "
+                "updated_at = ?, finished_at = ? "
+                "WHERE id = ? AND status = ? AND attempts = ?",
+                (JOB_SUCCEEDED, json.dumps(result, ensure_ascii=False), now, now,
+                 job_id, JOB_RUNNING, attempts)
+            )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def fail(self, job_id: str, attempts: int, error: str) -> bool:
+        """ジョブの失敗を記録する。リトライ回数が残っていれば再度キューに戻す
+
+        completeと同様に、古い実行からの書き込みは無視します。書き込めた場合にTrueを返します。
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            if attempts <= settings.JOB_MAX_RETRIES:
+                # 指数バックオフで再実行
+                available_at = now + settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, available_at = ?, "
+                    "started_at = NULL, updated_at = ? "
+                    "WHERE id = ? AND status = ? AND attempts = ?",
+                    (JOB_QUEUED, error, available_at, now, job_id, JOB_RUNNING, attempts)
+                )
+            else:
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, "
+                    "updated_at = ?, finished_at = ? "
+                    "WHERE id = ? AND status = ? AND attempts = ?",
+                    (JOB_FAILED, error, now, now, job_id, JOB_RUNNING, attempts)
+                )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """ジョブを取得する。TTLを過ぎた完了済みジョブは存在しないものとして扱う"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        job = dict(row)
+        if job["finished_at"] and job["finished_at"] < time.time() - settings.JOB_RESULT_TTL_SECONDS:
+            return None
+
+        return {
+            "job_id": job["id"],
+            "status": job["status"],
+            "attempts": job["attempts"],
+            "created_at": datetime.fromtimestamp(job["created_at"], tz=timezone.utc),
+            "updated_at": datetime.fromtimestamp(job["updated_at"], tz=timezone.utc),
+            "result": json.loads(job["result"]) if job["result"] else None,
+            "error": job["error"] if job["status"] == JOB_FAILED else None
+        }
+
+    def purge_expired(self) -> int:
+        """TTLを過ぎた完了済みジョブを削除し、削除件数を返す"""
+        expire_before = time.time() - settings.JOB_RESULT_TTL_SECONDS
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*JOB_FINISHED_STATUSES, expire_before)
+            )
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """キューの深さなどのメトリクスを返す"""
+        now = time.time()
+        expire_before = now - settings.JOB_RESULT_TTL_SECONDS
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs "
+                "WHERE finished_at IS NULL OR finished_at >= ? GROUP BY status",
+                (expire_before,)
+            ).fetchall()
+            oldest = conn.execute(
+                "SELECT MIN(created_at) AS oldest FROM jobs WHERE status = ?",
+                (JOB_QUEUED,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        result: Dict[str, Any] = {row["status"]: row["count"] for row in rows}
+        result["oldest_queued_age_seconds"] = (
+            now - oldest["oldest"] if oldest["oldest"] is not None else None
+        )
+        return result
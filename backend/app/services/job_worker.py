@@ -0,0 +1,149 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from typing import List, Optional
+
+from app.core.config import get_settings
+from app.services.job_queue import JobQueue
+
+settings = get_settings()
+
+# 完了済みジョブの掃除間隔（秒）
+PURGE_INTERVAL_SECONDS = 60
+
+# ワーカープロセスの死活確認の間隔（秒）
+SUPERVISE_INTERVAL_SECONDS = 5
+
+
+async def _run_job(queue: JobQueue, spot_service, job) -> None:
+    """1件のジョブを実行し、結果をキューに書き戻す"""
+    try:
+        result = await spot_service.search_and_summarize(job["payload"]["user_request"])
+        # /searchのレスポンスと同じくエイリアス（og:titleなど）をキーにして保存する。
+        # ポーリングではSpotSearchResponseとして再検証され、SSEではそのまま返される
+        written = await asyncio.to_thread(
+            queue.complete, job["id"], job["attempts"],
+            result.model_dump(mode="json", by_alias=True)
+        )
+    except Exception as e:
+        print(f"Job {job['id']} failed (attempt {job['attempts']}): {e}")
+        written = await asyncio.to_thread(queue.fail, job["id"], job["attempts"], str(e))
+
+    if not written:
+        # 可視性タイムアウト後に別のワーカーが取得し直したため、この実行の結果は破棄する
+        print(f"Job {job['id']} attempt {job['attempts']} was superseded; result discarded")
+
+
+async def _worker_loop(worker_index: int, stop_event) -> None:
+    """ワーカープロセス内のイベントループ本体"""
+    # SpotServiceはプロセスごとに生成する（モデルやグラフはプロセス間で共有できないため）
+    from app.services.spot_service import SpotService
+
+    spot_service = SpotService()
+    queue = JobQueue()
+    last_purged = 0.0
+
+    print(f"Job worker {worker_index} started")
+    while not stop_event.is_set():
+        try:
+            if time.time() - last_purged > PURGE_INTERVAL_SECONDS:
+                await asyncio.to_thread(queue.purge_expired)
+                last_purged = time.time()
+
+            job = await asyncio.to_thread(queue.claim)
+        except Exception as e:
+            # "database is locked" などで落ちないよう、記録して次のポーリングで再試行する
+            print(f"Job worker {worker_index} queue error: {e}")
+            job = None
+
+        if job is None:
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+            continue
+
+        try:
+            await _run_job(queue, spot_service, job)
+        except Exception as e:
+            # 結果の書き戻しに失敗した場合は、可視性タイムアウト後に再取得される
+            print(f"Job worker {worker_index} failed to record job {job['id']}: {e}")
+    print(f"Job worker {worker_index} stopped")
+
+
+def _worker_main(worker_index: int, stop_event) -> None:
+    asyncio.run(_worker_loop(worker_index, stop_event))
+
+
+class JobWorkerPool:
+    """検索パイプラインを別プロセスで実行するワーカープール
+
+    各プロセスは独自のイベントループを持ち、SQLiteのジョブキューからジョブを取り出して実行します。
+    """
+
+    def __init__(self, worker_count: Optional[int] = None):
+        self.worker_count = settings.JOB_WORKER_COUNT if worker_count is None else worker_count
+        # uvicornのイベントループを引き継がないようにspawnで起動する
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes: List[multiprocessing.Process] = []
+        self._supervisor: Optional[threading.Thread] = None
+
+    def _spawn(self, worker_index: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_index, self._stop_event),
+            name=f"job-worker-{worker_index}",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def start(self) -> None:
+        if self.worker_count <= 0:
+            return
+        # 起動前にテーブルを作成しておく
+        JobQueue()
+        self._processes = [self._spawn(i) for i in range(self.worker_count)]
+        self._supervisor = threading.Thread(
+            target=self._supervise, name="job-worker-supervisor", daemon=True
+        )
+        self._supervisor.start()
+
+    def _supervise(self) -> None:
+        """終了してしまったワーカープロセスを作り直す"""
+        while not self._stop_event.wait(SUPERVISE_INTERVAL_SECONDS):
+            for i, process in enumerate(self._processes):
+                if not process.is_alive() and not self._stop_event.is_set():
+                    print(f"Job worker {i} exited with code {process.exitcode}; restarting")
+                    self._processes[i] = self._spawn(i)
+
+    def stop(self, timeout: float = 8.0) -> None:
+        """ワーカーを停止する
+
+        timeoutは全プロセス合計の待ち時間で、Cloud RunのSIGTERM猶予（10秒）に収まるようにしている。
+        時間内に終わらなかったプロセスは強制終了し、そのジョブは可視性タイムアウト後に再取得される。
+        """
+        deadline = time.monotonic() + timeout
+        self._stop_event.set()
+        if self._supervisor is not None:
+            self._supervisor.join(max(0.0, deadline - time.monotonic()))
+            self._supervisor = None
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+
+if __name__ == "__main__":
+    # APIサーバーとは別にワーカーだけを起動する場合: python -m app.services.job_worker
+    pool = JobWorkerPool()
+    pool.start()
+    try:
+        # プロセスの作り直しはスーパーバイザーが行うので、ここでは停止を待つだけ
+        while True:
+            time.sleep(SUPERVISE_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop()
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from app.core.config import get_settings
+from app.models.spot import SpotSeekState
+
+settings = get_settings()
+
+PREFETCH_ACCEPTED = "accepted"
+PREFETCH_CACHED = "cached"
+PREFETCH_SKIPPED = "skipped"
+
+
+def normalize_request(user_request: str) -> str:
+    """キャッシュキー用に要望文を正規化する（前後と連続する空白の除去）"""
+    return " ".join(user_request.split())
+
+
+class _PrefetchEntry:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.task: Optional["asyncio.Task[SpotSeekState]"] = None
+        # デバウンスを抜けてセマフォを取得し、実際にステップを実行し始めたかどうか
+        self.started = False
+        self.created_at = time.monotonic()
+
+
+class PrefetchCache:
+    """投機的に実行したパイプライン前半の状態を短時間保持するキャッシュ
+
+    - 同じセッションから新しい入力が来たら、前の投機実行はキャンセルする（デバウンス）
+    - 実行中（デバウンス後にセマフォを取得したもの）の投機実行が上限に達していれば受け付けない
+    - TTLを過ぎたエントリは実行中でもキャンセルして破棄する
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _PrefetchEntry] = {}
+        self._sessions: Dict[str, str] = {}
+        # セマフォを取得して実行中の投機実行のタスク（キャッシュから取り出された後も含む）
+        self._running: Set["asyncio.Task[SpotSeekState]"] = set()
+        self._semaphore = asyncio.Semaphore(settings.PREFETCH_MAX_CONCURRENCY)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if now - entry.created_at > settings.PREFETCH_TTL_SECONDS:
+                self._cancel(key)
+
+    def _remove(self, key: str) -> Optional[_PrefetchEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        if self._sessions.get(entry.session_id) == key:
+            del self._sessions[entry.session_id]
+        return entry
+
+    def _cancel(self, key: str) -> None:
+        entry = self._remove(key)
+        if entry is not None and not entry.task.done():
+            entry.task.cancel()
+            # done-callbackを待たずに、すぐ実行中の数から外す
+            self._running.discard(entry.task)
+
+    async def _run(
+        self, entry: _PrefetchEntry, runner: Callable[[], Awaitable[SpotSeekState]]
+    ) -> SpotSeekState:
+        # デバウンス：待機中に次の入力が来ればここでキャンセルされる
+        await asyncio.sleep(settings.PREFETCH_DEBOUNCE_SECONDS)
+        async with self._semaphore:
+            entry.started = True
+            self._running.add(entry.task)
+            try:
+                return await runner()
+            finally:
+                self._running.discard(entry.task)
+
+    @staticmethod
+    def _log_failure(task: "asyncio.Task[SpotSeekState]") -> None:
+        # take()されずに破棄された場合も含め、例外はここで一度だけ記録する
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Prefetch failed: {task.exception()}")
+
+    def submit(
+        self,
+        session_id: str,
+        user_request: str,
+        runner: Callable[[], Awaitable[SpotSeekState]]
+    ) -> str:
+        """投機実行を登録し、その結果（accepted / cached / skipped）を返す"""
+        self._purge_expired()
+        key = normalize_request(user_request)
+        if not key:
+            return PREFETCH_SKIPPED
+
+        if key in self._entries:
+            return PREFETCH_CACHED
+
+        # 同じセッションの古い入力に対する投機実行は不要になる
+        previous_key = self._sessions.get(session_id)
+        if previous_key is not None:
+            self._cancel(previous_key)
+
+        # 投機実行が本番のリクエストを圧迫しないよう、上限に達していれば実行しない
+        if len(self._running) >= settings.PREFETCH_MAX_CONCURRENCY or len(self._entries) >= settings.PREFETCH_MAX_ENTRIES:
+            return PREFETCH_SKIPPED
+
+        entry = _PrefetchEntry(session_id)
+        entry.task = asyncio.create_task(self._run(entry, runner))
+        entry.task.add_done_callback(self._log_failure)
+        self._entries[key] = entry
+        self._sessions[session_id] = key
+        return PREFETCH_ACCEPTED
+
+    async def take(self, user_request: str) -> Optional[SpotSeekState]:
+        """一致する投機実行の結果を取り出す。無い、または失敗していればNoneを返す"""
+        self._purge_expired()
+        entry = self._remove(normalize_request(user_request))
+        if entry is None:
+            return None
+
+        if entry.task.cancelled():
+            return None
+        if not entry.started:
+            # デバウンス中やセマフォ待ちのものを待つと本番のリクエストが遅れるため、
+            # 投機実行は止めて呼び出し側で最初から実行させる
+            entry.task.cancel()
+            return None
+
+        try:
+            # 実行中であれば完了を待つ（ここからは本番のリクエストとして扱う）
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            # 呼び出し側がキャンセルされた場合は投機実行も止めて伝搬させる
+            entry.task.cancel()
+            raise
+        except Exception:
+            # 例外の記録は_log_failureで行い、呼び出し側では最初から実行させる
+            return None
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, AsyncGenerator
+from typing import List, Dict, Any, AsyncGenerator, Optional
 from fastapi import HTTPException, Request
 from app.core.config import get_settings
 from app.models.spot import (
@@ -338,14 +338,12 @@ pageSize=5
 
     ################# ストリーミング用のメソッド #################
 
-    async def preprocess_search(self, user_request: str) -> Dict[str, Any]:
-        """前処理：スポット情報の取得"""
-        # 既存のワークフローの一部を実行
-        initial_state = SpotSeekState(user_request=user_request)
-        state = initial_state
+    # 入力途中でも結果が変わらない前半のステップ（投機的プリフェッチの対象）
+    PREFETCH_STEPS = ("generate_query", "search_spots", "get_place_details")
 
+    def _preprocess_steps(self) -> Dict[str, Any]:
         # generate_queryからrank_placesまでを実行
-        workflow_steps = {
+        return {
             "generate_query": self._generate_query_node,
             "search_spots": self._search_spots_node,
             "get_place_details": self._get_place_details_node,
@@ -353,10 +351,37 @@ pageSize=5
             "rank_places": self._rank_places_node
         }
 
-        for step_name, step_func in workflow_steps.items():
-            result = await step_func(state)
+    async def _run_steps(self, state: SpotSeekState, step_names) -> SpotSeekState:
+        workflow_steps = self._preprocess_steps()
+        for step_name in step_names:
+            result = await workflow_steps[step_name](state)
             for key, value in result.items():
                 setattr(state, key, value)
+        return state
+
+    async def prefetch_state(self, user_request: str) -> SpotSeekState:
+        """投機実行：前半のステップだけを実行した状態を返す"""
+        return await self._run_steps(
+            SpotSeekState(user_request=user_request), self.PREFETCH_STEPS
+        )
+
+    async def preprocess_search(
+        self, user_request: str, prefetched_state: Optional[SpotSeekState] = None
+    ) -> Dict[str, Any]:
+        """前処理：スポット情報の取得
+
+        prefetched_stateが渡された場合は、プリフェッチ済みのステップを飛ばして続きから実行します。
+        """
+        if prefetched_state is not None:
+            state = prefetched_state
+            step_names = [
+                name for name in self._preprocess_steps() if name not in self.PREFETCH_STEPS
+            ]
+        else:
+            state = SpotSeekState(user_request=user_request)
+            step_names = list(self._preprocess_steps())
+
+        state = await self._run_steps(state, step_names)
 
         return {
             "places": state.enriched_places,
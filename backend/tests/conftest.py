@@ -0,0 +1,12 @@
+import os
+
+# Settingsの必須項目（テストでは外部APIを呼ばないのでダミー値で良い）
+for _key in (
+    "API_KEY",
+    "GOOGLE_MAPS_API_KEY",
+    "CUSTOM_SEARCH_API_KEY",
+    "CUSTOM_SEARCH_CX",
+    "GOOGLE_API_KEY",
+    "GOOGLE_CLOUD_PROJECT",
+):
+    os.environ.setdefault(_key, "test")
@@ -0,0 +1,101 @@
+import pytest
+
+from app.core.config import get_settings
+from app.services.job_queue import (
+    JobQueue, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED
+)
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "JOB_MAX_RETRIES", 1)
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(settings, "JOB_RESULT_TTL_SECONDS", 3600)
+    monkeypatch.setattr(settings, "JOB_VISIBILITY_TIMEOUT_SECONDS", 300)
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+def expire_claims(monkeypatch):
+    # 実行中のジョブを即座に可視性タイムアウト切れとして扱う
+    monkeypatch.setattr(get_settings(), "JOB_VISIBILITY_TIMEOUT_SECONDS", -1)
+
+
+def test_claim_marks_job_running(queue):
+    job_id = queue.enqueue({"user_request": "神田でラーメン"})
+
+    job = queue.claim()
+
+    assert job["id"] == job_id
+    assert job["status"] == JOB_RUNNING
+    assert job["attempts"] == 1
+    assert job["payload"] == {"user_request": "神田でラーメン"}
+    assert queue.get(job_id)["status"] == JOB_RUNNING
+    assert queue.claim() is None
+
+
+def test_fail_requeues_until_retries_are_exhausted(queue):
+    job_id = queue.enqueue({"user_request": "a"})
+
+    job = queue.claim()
+    assert queue.fail(job_id, job["attempts"], "boom")
+    assert queue.get(job_id)["status"] == JOB_QUEUED
+
+    job = queue.claim()
+    assert job["attempts"] == 2
+    assert queue.fail(job_id, job["attempts"], "boom again")
+
+    result = queue.get(job_id)
+    assert result["status"] == JOB_FAILED
+    assert result["error"] == "boom again"
+    assert queue.claim() is None
+
+
+def test_stale_job_is_reclaimed_then_failed(queue, monkeypatch):
+    expire_claims(monkeypatch)
+    job_id = queue.enqueue({"user_request": "a"})
+
+    assert queue.claim()["attempts"] == 1
+    assert queue.claim()["attempts"] == 2
+    assert queue.claim() is None
+
+    result = queue.get(job_id)
+    assert result["status"] == JOB_FAILED
+    assert result["error"] == "Job timed out"
+
+
+def test_superseded_attempt_cannot_overwrite_result(queue, monkeypatch):
+    expire_claims(monkeypatch)
+    job_id = queue.enqueue({"user_request": "a"})
+    first = queue.claim()
+    second = queue.claim()
+
+    assert queue.complete(job_id, second["attempts"], {"summary": "new"})
+    assert not queue.fail(job_id, first["attempts"], "late failure")
+    assert not queue.complete(job_id, first["attempts"], {"summary": "old"})
+
+    result = queue.get(job_id)
+    assert result["status"] == JOB_SUCCEEDED
+    assert result["result"] == {"summary": "new"}
+
+
+def test_expired_results_are_hidden_and_purged(queue, monkeypatch):
+    job_id = queue.enqueue({"user_request": "a"})
+    job = queue.claim()
+    queue.complete(job_id, job["attempts"], {"summary": "s"})
+    monkeypatch.setattr(get_settings(), "JOB_RESULT_TTL_SECONDS", -1)
+
+    assert queue.get(job_id) is None
+    assert queue.purge_expired() == 1
+
+
+def test_metrics_report_queue_depth(queue):
+    queue.enqueue({"user_request": "a"})
+    queue.enqueue({"user_request": "b"})
+    queue.claim()
+
+    metrics = queue.metrics()
+
+    assert metrics[JOB_QUEUED] == 1
+    assert metrics[JOB_RUNNING] == 1
+    assert metrics["oldest_queued_age_seconds"] >= 0
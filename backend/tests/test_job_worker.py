@@ -0,0 +1,43 @@
+import asyncio
+
+from app.models.spot import (
+    JobStatusResponse, NewsArticle, PlaceResult, PlaceWithNews, SpotSearchResponse
+)
+from app.services.job_queue import JobQueue, JOB_SUCCEEDED
+from app.services.job_worker import _run_job
+
+
+class StubSpotService:
+    async def search_and_summarize(self, user_request: str) -> SpotSearchResponse:
+        place = PlaceResult.model_validate({
+            "place_id": "p1",
+            "name": "テスト食堂",
+            "formatted_address": "東京都千代田区",
+            "geometry": {
+                "location": {"lat": 35.0, "lng": 139.0},
+                "viewport": {
+                    "northeast": {"lat": 35.1, "lng": 139.1},
+                    "southwest": {"lat": 34.9, "lng": 138.9}
+                }
+            },
+            "types": ["restaurant"],
+            "url": "https://maps.google.com/?cid=1"
+        })
+        article = NewsArticle.model_validate({"og:title": "話題の店", "og:site_name": "ニュース"})
+        return SpotSearchResponse(
+            places=[PlaceWithNews(place=place, news_articles=[article])],
+            summary=f"{user_request}のおすすめ"
+        )
+
+
+def test_stored_result_validates_as_job_status(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+    job_id = queue.enqueue({"user_request": "神田でラーメン"})
+
+    asyncio.run(_run_job(queue, StubSpotService(), queue.claim()))
+
+    job = queue.get(job_id)
+    assert job["status"] == JOB_SUCCEEDED
+    status = JobStatusResponse.model_validate(job)
+    assert status.result.places[0].news_articles[0].title == "話題の店"
+    assert status.result.summary == "神田でラーメンのおすすめ"
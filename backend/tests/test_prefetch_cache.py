@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.prefetch_cache import (
+    PrefetchCache, PREFETCH_ACCEPTED, PREFETCH_CACHED, PREFETCH_SKIPPED
+)
+
+
+@pytest.fixture(autouse=True)
+def prefetch_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "PREFETCH_DEBOUNCE_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "PREFETCH_TTL_SECONDS", 30)
+    monkeypatch.setattr(settings, "PREFETCH_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "PREFETCH_MAX_ENTRIES", 50)
+
+
+def make_runner(result="state", delay=0.05, calls=None):
+    async def runner():
+        if calls is not None:
+            calls.append(result)
+        await asyncio.sleep(delay)
+        return result
+    return runner
+
+
+def test_take_returns_prefetched_state():
+    async def scenario():
+        cache = PrefetchCache()
+        assert cache.submit("s1", " 神田  ラーメン ", make_runner()) == PREFETCH_ACCEPTED
+        assert cache.submit("s1", "神田 ラーメン", make_runner()) == PREFETCH_CACHED
+        await asyncio.sleep(0.03)
+        return await cache.take("神田 ラーメン")
+
+    assert asyncio.run(scenario()) == "state"
+
+
+def test_new_input_cancels_previous_prefetch_of_same_session():
+    calls = []
+
+    async def scenario():
+        cache = PrefetchCache()
+        cache.submit("s1", "神田", make_runner("old", calls=calls))
+        cache.submit("s1", "神田 ラーメン", make_runner("new", calls=calls))
+        await asyncio.sleep(0.1)
+        return await cache.take("神田"), await cache.take("神田 ラーメン")
+
+    assert asyncio.run(scenario()) == (None, "new")
+    assert calls == ["new"]
+
+
+def test_session_input_is_not_skipped_while_others_are_debouncing():
+    async def scenario():
+        cache = PrefetchCache()
+        assert cache.submit("a", "神田", make_runner()) == PREFETCH_ACCEPTED
+        assert cache.submit("b", "渋谷", make_runner()) == PREFETCH_ACCEPTED
+        assert cache.submit("a", "神田 ラーメン", make_runner()) == PREFETCH_ACCEPTED
+
+    asyncio.run(scenario())
+
+
+def test_submit_skips_when_running_prefetches_reach_cap():
+    async def scenario():
+        cache = PrefetchCache()
+        cache.submit("a", "神田", make_runner(delay=0.2))
+        await asyncio.sleep(0.05)
+        # 取り出された後も実行中であれば上限に数える
+        taking = asyncio.create_task(cache.take("神田"))
+        await asyncio.sleep(0)
+        status = cache.submit("b", "渋谷", make_runner())
+        await taking
+        return status
+
+    assert asyncio.run(scenario()) == PREFETCH_SKIPPED
+
+
+def test_take_before_debounce_cancels_prefetch():
+    calls = []
+
+    async def scenario():
+        cache = PrefetchCache()
+        cache.submit("a", "神田", make_runner(calls=calls))
+        result = await cache.take("神田")
+        await asyncio.sleep(0.05)
+        return result
+
+    assert asyncio.run(scenario()) is None
+    assert calls == []
+
+
+def test_take_propagates_caller_cancellation():
+    async def scenario():
+        cache = PrefetchCache()
+        cache.submit("a", "神田", make_runner(delay=0.2))
+        await asyncio.sleep(0.05)
+        taking = asyncio.create_task(cache.take("神田"))
+        await asyncio.sleep(0.01)
+        taking.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await taking
+
+    asyncio.run(scenario())
+
+
+def test_failed_prefetch_is_logged_once(capsys):
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+        cache = PrefetchCache()
+        cache.submit("a", "神田", failing)
+        await asyncio.sleep(0.05)
+        # 取り出されないまま置き換えられる
+        cache.submit("a", "神田 ラーメン", make_runner())
+        await asyncio.sleep(0.05)
+        return unhandled
+
+    import gc
+    unhandled = asyncio.run(scenario())
+    gc.collect()
+    assert unhandled == []
+    assert capsys.readouterr().out.count("Prefetch failed: boom") == 1